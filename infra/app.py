@@ -23,7 +23,10 @@ from stacks.agentcore_gateway.confluence_gateway_stack import ConfluenceGatewayS
 app = cdk.App()
 
 # ─── Dev stack ────────────────────────────────────────────────────────────────
-stack = ConfluenceGatewayStack(
+# `tags=` become CloudFormation stack tags, which CloudFormation propagates to
+# supported resources at deploy time. The gateway itself is also tagged
+# explicitly via AgentCoreGateway(tags=config.TAGS).
+ConfluenceGatewayStack(
     app,
     config.STACK_NAME,
     config=config,
@@ -34,8 +37,4 @@ stack = ConfluenceGatewayStack(
     tags=config.TAGS,
 )
 
-# ─── Apply tags to all resources in the stack ─────────────────────────────────
-for key, value in config.TAGS.items():
-    cdk.Tags.of(stack).add(key, value)
-
 app.synth()
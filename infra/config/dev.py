@@ -3,49 +3,158 @@ infra/config/dev.py
 
 Development environment configuration.
 All values are read from AWS SSM Parameter Store — no secrets are hardcoded.
+SSM-backed values are fetched lazily on first attribute access, so importing
+this module performs no network calls.
 
 Required SSM Parameters (create these once manually or via setup-guide.md):
   /confluence/gateway/aws-account-id        → AWS account ID
   /confluence/gateway/aws-region            → AWS region (e.g. us-east-1)
   /confluence/gateway/confluence-subdomain  → Atlassian subdomain (e.g. rassk97)
   /confluence/gateway/credential-provider-arn → Created by create_apikey_provider.py
+                                              (resolved at deploy time, not synth)
 """
 
-import boto3
+import hashlib
+import json
 import os
-from botocore.exceptions import ClientError
+import time
+
+# boto3/botocore are imported inside the SSM helpers rather than here: the
+# import is slow and is only needed once an SSM-backed value is first read.
 
 # ─── Region ───────────────────────────────────────────────────────────────────
 # Allow override via environment variable (GitHub Actions sets AWS_REGION)
 _REGION = os.environ.get("AWS_REGION", "us-east-1")
 
-
-def _get_ssm(name: str, default: str = "") -> str:
+# ─── Local parameter cache ────────────────────────────────────────────────────
+# Plain-string values are cached on disk for a short TTL so repeated
+# `cdk synth` / `cdk diff` runs skip SSM. SecureStrings are never written.
+# Set CONFLUENCE_GATEWAY_NO_CACHE=1 to bypass the cache and force a refresh.
+_CACHE_FILE = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+    "confluence-gateway",
+    "ssm.json",
+)
+_CACHE_TTL_SECONDS = 15 * 60
+_CACHE_DISABLED = os.environ.get("CONFLUENCE_GATEWAY_NO_CACHE") == "1"
+
+# Cached values are account-specific, so entries are keyed by the credentials
+# in use: the access key ID when set explicitly, otherwise the named profile.
+# Only a short hash is stored so credential identifiers never reach the disk.
+_CACHE_IDENTITY = hashlib.sha256(
+    (
+        os.environ.get("AWS_ACCESS_KEY_ID")
+        or os.environ.get("AWS_PROFILE")
+        or os.environ.get("AWS_DEFAULT_PROFILE")
+        or "default"
+    ).encode("utf-8")
+).hexdigest()[:16]
+
+# One SSM client per region, shared by every parameter lookup during synth
+_SSM_CLIENTS: dict = {}
+
+
+def _get_ssm_client(region: str = _REGION):
+    """Return the cached SSM client for `region`, creating it on first use."""
+    if region not in _SSM_CLIENTS:
+        import boto3
+        from botocore.config import Config
+
+        # Keep-alive pooled connections + adaptive retries
+        _SSM_CLIENTS[region] = boto3.client(
+            "ssm",
+            region_name=region,
+            config=Config(
+                tcp_keepalive=True,
+                max_pool_connections=10,
+                retries={"mode": "adaptive", "total_max_attempts": 5},
+            ),
+        )
+    return _SSM_CLIENTS[region]
+
+
+def _read_cache() -> dict:
     """
-    Fetch a plain-string SSM parameter.
-    Falls back to `default` if the parameter is missing (useful for first-time bootstrap).
+    Load the on-disk parameter cache. A missing, corrupt or wrongly shaped file
+    is treated as empty, and malformed entries are dropped.
     """
     try:
-        ssm = boto3.client("ssm", region_name=_REGION)
-        resp = ssm.get_parameter(Name=name)
-        return resp["Parameter"]["Value"]
-    except ClientError as e:
-        code = e.response["Error"]["Code"]
-        if code == "ParameterNotFound":
-            if default:
-                print(f"⚠️  SSM param '{name}' not found — using default: '{default}'")
-                return default
+        with open(_CACHE_FILE, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    return {
+        key: entry
+        for key, entry in cache.items()
+        if isinstance(entry, dict)
+        and isinstance(entry.get("value"), str)
+        and isinstance(entry.get("fetched_at"), (int, float))
+    }
+
+
+def _write_cache(cache: dict) -> None:
+    """Persist the parameter cache atomically. Failures are non-fatal."""
+    try:
+        os.makedirs(os.path.dirname(_CACHE_FILE), exist_ok=True)
+        tmp = f"{_CACHE_FILE}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp, _CACHE_FILE)
+    except OSError:
+        pass
+
+
+def _cache_key(name: str) -> str:
+    return f"{_CACHE_IDENTITY}:{_REGION}:{name}"
+
+
+def _get_ssm_batch(params: dict) -> dict:
+    """
+    Fetch several plain-string SSM parameters in a single GetParameters call.
+    `params` maps parameter name → default; a missing parameter falls back to its
+    default (useful for first-time bootstrap) or raises if the default is empty.
+    Values found in the local cache (younger than the TTL) are not re-fetched.
+    """
+    now = time.time()
+    cache = {} if _CACHE_DISABLED else _read_cache()
+    values = {}
+    for name in params:
+        entry = cache.get(_cache_key(name))
+        if entry and now - entry["fetched_at"] < _CACHE_TTL_SECONDS:
+            values[name] = entry["value"]
+
+    to_fetch = [name for name in params if name not in values]
+    if not to_fetch:
+        return values
+
+    ssm = _get_ssm_client()
+    resp = ssm.get_parameters(Names=to_fetch, WithDecryption=True)
+    for p in resp["Parameters"]:
+        values[p["Name"]] = p["Value"]
+        if p["Type"] != "SecureString":
+            cache[_cache_key(p["Name"])] = {"value": p["Value"], "fetched_at": now}
+    _write_cache(cache)
+
+    for name in resp["InvalidParameters"]:
+        default = params[name]
+        if not default:
             raise RuntimeError(
                 f"Required SSM parameter '{name}' not found in region '{_REGION}'.\n"
                 f"Run setup-guide.md steps to create it."
-            ) from e
-        raise
+            )
+        print(f"⚠️  SSM param '{name}' not found — using default: '{default}'")
+        values[name] = default
+    return values
 
 
 def _get_ssm_secure(name: str) -> str:
     """Fetch a SecureString SSM parameter (decrypted)."""
+    from botocore.exceptions import ClientError
+
     try:
-        ssm = boto3.client("ssm", region_name=_REGION)
+        ssm = _get_ssm_client()
         resp = ssm.get_parameter(Name=name, WithDecryption=True)
         return resp["Parameter"]["Value"]
     except ClientError as e:
@@ -61,16 +170,6 @@ def _get_ssm_secure(name: str) -> str:
 # ─── Environment tag ──────────────────────────────────────────────────────────
 ENV = "dev"
 
-# ─── AWS Account & Region ─────────────────────────────────────────────────────
-AWS_ACCOUNT = _get_ssm(
-    "/confluence/gateway/aws-account-id",
-    default=os.environ.get("CDK_DEFAULT_ACCOUNT", "")
-)
-AWS_REGION = _get_ssm(
-    "/confluence/gateway/aws-region",
-    default=_REGION
-)
-
 # ─── CDK Stack name ───────────────────────────────────────────────────────────
 STACK_NAME = f"ConfluenceGatewayStack-{ENV.capitalize()}"
 
@@ -79,16 +178,8 @@ GATEWAY_NAME = f"confluence-gateway-{ENV}"
 GATEWAY_DESCRIPTION = "AgentCore Gateway for Confluence integration (dev)"
 
 # ─── Credential Provider ARN (set by create_apikey_provider.py) ───────────────
-CREDENTIAL_PROVIDER_ARN = _get_ssm(
-    "/confluence/gateway/credential-provider-arn",
-    default=""   # empty until the script is run
-)
-
-# ─── Confluence config (informational — used in tests) ────────────────────────
-CONFLUENCE_SUBDOMAIN = _get_ssm(
-    "/confluence/gateway/confluence-subdomain",
-    default="rassk97"
-)
+# Resolved by CloudFormation at deploy time, not read during synth
+CREDENTIAL_PROVIDER_ARN_PARAM = "/confluence/gateway/credential-provider-arn"
 
 # ─── Tags applied to all CDK resources ────────────────────────────────────────
 TAGS = {
@@ -96,3 +187,30 @@ TAGS = {
     "Project": "ConfluenceGateway",
     "ManagedBy": "CDK",
 }
+
+# ─── SSM-backed values (resolved lazily — see __getattr__ below) ──────────────
+# Module attribute → (SSM parameter, default when the parameter is missing)
+_SSM_ATTRS = {
+    # AWS Account & Region
+    "AWS_ACCOUNT": (
+        "/confluence/gateway/aws-account-id",
+        os.environ.get("CDK_DEFAULT_ACCOUNT", ""),
+    ),
+    "AWS_REGION": ("/confluence/gateway/aws-region", _REGION),
+    # Confluence config (informational — used in tests)
+    "CONFLUENCE_SUBDOMAIN": ("/confluence/gateway/confluence-subdomain", "rassk97"),
+}
+
+
+def __getattr__(name: str) -> str:
+    """
+    Resolve SSM-backed settings on first access (PEP 562), so importing this
+    module does no network I/O. All parameters are fetched together in one
+    GetParameters call and stored as regular module globals afterwards.
+    """
+    if name not in _SSM_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    values = _get_ssm_batch(dict(_SSM_ATTRS.values()))
+    for attr, (param, _default) in _SSM_ATTRS.items():
+        globals()[attr] = values[param]
+    return globals()[name]
@@ -139,7 +139,8 @@ echo ""
 if [ "$RUN_TESTS" = true ]; then
   echo "━━━ Step 6: Integration Tests ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
   info "Running integration tests..."
-  python3 test/test_api_gateway.py
+  # Always re-query tools/list: the gateway was just redeployed
+  python3 test/test_api_gateway.py --refresh
   success "All tests passed."
   echo ""
 else
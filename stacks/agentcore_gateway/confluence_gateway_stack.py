@@ -10,6 +10,7 @@ from aws_cdk import (
     Stack,
     CfnOutput,
     aws_iam as iam,
+    aws_ssm as ssm,
 )
 from constructs import Construct
 from typing import Any
@@ -64,9 +65,13 @@ class ConfluenceGatewayStack(Stack):
             export_name=f"{stack_id}-GatewayRoleArn",
         )
 
+        # SSM-typed CloudFormation parameter, resolved at deploy time, so synth
+        # never has to read the ARN from SSM
         CfnOutput(
             self,
             "CredentialProviderArn",
-            value=config.CREDENTIAL_PROVIDER_ARN or "NOT_SET_YET",
+            value=ssm.StringParameter.value_for_string_parameter(
+                self, config.CREDENTIAL_PROVIDER_ARN_PARAM
+            ),
             description="API Key Credential Provider ARN (from SSM)",
         )
@@ -18,7 +18,10 @@ Environment variables:
 
 import os
 import sys
+from functools import lru_cache
+from typing import Optional
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 # ─── Config ───────────────────────────────────────────────────────────────────
@@ -31,21 +34,78 @@ API_KEY = os.environ.get("CONFLUENCE_API_KEY", "")
 # ─────────────────────────────────────────────────────────────────────────────
 
 
+# Shared botocore config: keep-alive pooled connections + adaptive retries.
+# Control-plane APIs throttle aggressively, so allow a larger retry budget;
+# adaptive mode rate-limits client-side and backs off with jitter.
+_BOTO_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=10,
+    retries={"mode": "adaptive", "total_max_attempts": 10},
+)
+
+# One SSM client per region, shared by the region lookup and the ARN write
+_SSM_CLIENTS: dict = {}
+
+
+def _get_ssm_client(region: str):
+    """Return the cached SSM client for `region`, creating it on first use."""
+    if region not in _SSM_CLIENTS:
+        _SSM_CLIENTS[region] = boto3.client(
+            "ssm",
+            region_name=region,
+            config=_BOTO_CONFIG,
+        )
+    return _SSM_CLIENTS[region]
+
+
+@lru_cache(maxsize=None)
 def get_region_from_ssm() -> str:
     """Try to read the canonical region from SSM, fall back to env var."""
     try:
-        ssm = boto3.client("ssm", region_name=REGION)
+        ssm = _get_ssm_client(REGION)
         resp = ssm.get_parameter(Name="/confluence/gateway/aws-region")
         return resp["Parameter"]["Value"]
     except Exception:
         return REGION
 
 
+def _find_provider(agentcore) -> Optional[dict]:
+    """
+    Return the API Key credential provider named PROVIDER_NAME, or None.
+    Pages through the list and stops at the first match.
+    """
+    paginator = agentcore.get_paginator("list_api_key_credential_providers")
+    for page in paginator.paginate(PaginationConfig={"PageSize": 50}):
+        # API may return 'items', 'credentialProviders', or similar
+        for p in page.get("items") or page.get("credentialProviders") or []:
+            if p.get("name") == PROVIDER_NAME:
+                return p
+    return None
+
+
 def create_or_get_provider(region: str) -> str:
-    agentcore = boto3.client("bedrock-agentcore-control", region_name=region)
-    print(f"\n🔑 Creating API Key credential provider: {PROVIDER_NAME}")
+    agentcore = boto3.client(
+        "bedrock-agentcore-control", region_name=region, config=_BOTO_CONFIG
+    )
 
     try:
+        existing = _find_provider(agentcore)
+
+        if existing:
+            print(f"\n🔑 Provider {PROVIDER_NAME} already exists — updating API key...")
+            update_resp = agentcore.update_api_key_credential_provider(
+                name=PROVIDER_NAME,
+                apiKey=API_KEY,
+            )
+            arn = (
+                update_resp.get("credentialProviderArn")
+                or existing.get("credentialProviderArn")
+                or existing.get("arn")
+            )
+            print(f"✅ Updated!  ARN: {arn}")
+            return arn
+
+        print(f"\n🔑 Creating API Key credential provider: {PROVIDER_NAME}")
         resp = agentcore.create_api_key_credential_provider(
             name=PROVIDER_NAME,
             apiKey=API_KEY,
@@ -57,44 +117,12 @@ def create_or_get_provider(region: str) -> str:
     except ClientError as e:
         code = e.response["Error"]["Code"]
         msg  = e.response["Error"]["Message"]
-
-        if "ConflictException" in code or "already exists" in msg.lower():
-            print("⚠️  Provider already exists — updating API key and fetching ARN...")
-            try:
-                update_resp = agentcore.update_api_key_credential_provider(
-                    name=PROVIDER_NAME,
-                    apiKey=API_KEY,
-                )
-                arn = update_resp.get("credentialProviderArn") or update_resp.get("arn")
-                print(f"✅ Updated!  ARN: {arn}")
-                return arn
-            except Exception as update_err:
-                # update failed — try listing as a last resort
-                print(f"⚠️  Update failed ({update_err}), trying list...")
-                try:
-                    providers_resp = agentcore.list_api_key_credential_providers()
-                    # API may return 'items', 'credentialProviders', or similar
-                    items = (
-                        providers_resp.get("items")
-                        or providers_resp.get("credentialProviders")
-                        or []
-                    )
-                    for p in items:
-                        if p.get("name") == PROVIDER_NAME:
-                            arn = p.get("credentialProviderArn") or p.get("arn")
-                            print(f"   Found ARN via list: {arn}")
-                            return arn
-                except Exception as list_err:
-                    print(f"⚠️  List also failed: {list_err}")
-                print("❌ Could not retrieve existing provider ARN.")
-                sys.exit(1)
-        else:
-            print(f"❌ Error: {code} — {msg}")
-            sys.exit(1)
+        print(f"❌ Error: {code} — {msg}")
+        sys.exit(1)
 
 
 def write_arn_to_ssm(arn: str, region: str):
-    ssm = boto3.client("ssm", region_name=region)
+    ssm = _get_ssm_client(region)
     ssm.put_parameter(
         Name=SSM_PARAM_ARN,
         Value=arn,
@@ -25,7 +25,10 @@ Atlassian OAuth 2.0 app configuration:
 
 import os
 import sys
+from functools import lru_cache
+from typing import Optional
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 # ─── Config ───────────────────────────────────────────────────────────────────
@@ -44,20 +47,68 @@ CLIENT_SECRET = os.environ.get("OAUTH_CLIENT_SECRET", "")
 # ─────────────────────────────────────────────────────────────────────────────
 
 
+# Shared botocore config: keep-alive pooled connections + adaptive retries.
+# Control-plane APIs throttle aggressively, so allow a larger retry budget;
+# adaptive mode rate-limits client-side and backs off with jitter.
+_BOTO_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=10,
+    retries={"mode": "adaptive", "total_max_attempts": 10},
+)
+
+# One SSM client per region, shared by the region lookup and the ARN write
+_SSM_CLIENTS: dict = {}
+
+
+def _get_ssm_client(region: str):
+    """Return the cached SSM client for `region`, creating it on first use."""
+    if region not in _SSM_CLIENTS:
+        _SSM_CLIENTS[region] = boto3.client(
+            "ssm",
+            region_name=region,
+            config=_BOTO_CONFIG,
+        )
+    return _SSM_CLIENTS[region]
+
+
+@lru_cache(maxsize=None)
 def get_region_from_ssm() -> str:
     try:
-        ssm = boto3.client("ssm", region_name=REGION)
+        ssm = _get_ssm_client(REGION)
         resp = ssm.get_parameter(Name="/confluence/gateway/aws-region")
         return resp["Parameter"]["Value"]
     except Exception:
         return REGION
 
 
+def _find_provider(agentcore) -> Optional[dict]:
+    """
+    Return the OAuth 2.0 credential provider named PROVIDER_NAME, or None.
+    Pages through the list and stops at the first match.
+    """
+    paginator = agentcore.get_paginator("list_oauth2_credential_providers")
+    # ListOauth2CredentialProviders caps maxResults at 20
+    for page in paginator.paginate(PaginationConfig={"PageSize": 20}):
+        for p in page.get("items") or page.get("credentialProviders") or []:
+            if p.get("name") == PROVIDER_NAME:
+                return p
+    return None
+
+
 def create_or_get_provider(region: str) -> str:
-    agentcore = boto3.client("bedrock-agentcore-control", region_name=region)
-    print(f"\n🔐 Creating OAuth credential provider: {PROVIDER_NAME}")
+    agentcore = boto3.client(
+        "bedrock-agentcore-control", region_name=region, config=_BOTO_CONFIG
+    )
 
     try:
+        existing = _find_provider(agentcore)
+        if existing:
+            arn = existing.get("credentialProviderArn") or existing.get("arn")
+            print(f"\n🔐 Provider {PROVIDER_NAME} already exists")
+            print(f"   Existing ARN: {arn}")
+            return arn
+
+        print(f"\n🔐 Creating OAuth credential provider: {PROVIDER_NAME}")
         resp = agentcore.create_oauth2_credential_provider(
             name=PROVIDER_NAME,
             credentialProviderVendor="CUSTOM",
@@ -84,24 +135,12 @@ def create_or_get_provider(region: str) -> str:
     except ClientError as e:
         code = e.response["Error"]["Code"]
         msg  = e.response["Error"]["Message"]
-
-        if "ConflictException" in code or "already exists" in msg:
-            print("⚠️  Provider already exists — fetching existing ARN...")
-            providers = agentcore.list_oauth2_credential_providers()
-            for p in providers.get("items", []):
-                if p.get("name") == PROVIDER_NAME:
-                    arn = p.get("credentialProviderArn") or p.get("arn")
-                    print(f"   Existing ARN: {arn}")
-                    return arn
-            print("❌ Could not find existing provider.")
-            sys.exit(1)
-        else:
-            print(f"❌ Error ({code}): {msg}")
-            sys.exit(1)
+        print(f"❌ Error ({code}): {msg}")
+        sys.exit(1)
 
 
 def write_arn_to_ssm(arn: str, region: str):
-    ssm = boto3.client("ssm", region_name=region)
+    ssm = _get_ssm_client(region)
     ssm.put_parameter(
         Name=SSM_PARAM_ARN,
         Value=arn,
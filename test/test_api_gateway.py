@@ -6,7 +6,8 @@ Integration test for the AgentCore Gateway with API Key Authentication.
 All configuration is read from SSM Parameter Store — no hardcoded values.
 
 Usage:
-    python3 test/test_api_gateway.py
+    python3 test/test_api_gateway.py            # tools/list served from cache if fresh
+    python3 test/test_api_gateway.py --refresh  # always re-query tools/list
 
 Prerequisites:
     - AWS credentials configured (env vars or ~/.aws/credentials)
@@ -15,21 +16,50 @@ Prerequisites:
 """
 
 import boto3
-import requests
+import hashlib
+import hmac
+import httpx
 import json
+import os
 import sys
-from botocore.auth import SigV4Auth
-from botocore.awsrequest import AWSRequest
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from urllib.parse import parse_qsl, quote, urlsplit
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 # ─── Load config from SSM ─────────────────────────────────────────────────────
-REGION       = __import__("os").environ.get("AWS_REGION", "us-east-1")
+REGION       = os.environ.get("AWS_REGION", "us-east-1")
 SERVICE_NAME = "bedrock-agentcore"
 
+# Shared botocore config: keep-alive pooled connections + adaptive retries
+_BOTO_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=10,
+    retries={"mode": "adaptive", "total_max_attempts": 5},
+)
+
+# Single SSM client shared by every _ssm_get() lookup
+_SSM_CLIENTS: dict = {}
+
+
+def _get_ssm_client(region: str = REGION):
+    if region not in _SSM_CLIENTS:
+        _SSM_CLIENTS[region] = boto3.client(
+            "ssm",
+            region_name=region,
+            config=_BOTO_CONFIG,
+        )
+    return _SSM_CLIENTS[region]
+
 
+@lru_cache(maxsize=None)
 def _ssm_get(name: str, default: str = "") -> str:
     try:
-        ssm = boto3.client("ssm", region_name=REGION)
+        ssm = _get_ssm_client()
         return ssm.get_parameter(Name=name)["Parameter"]["Value"]
     except ClientError:
         if default:
@@ -46,15 +76,90 @@ GATEWAY_URL = (
     f"https://{GATEWAY_ID}.gateway.bedrock-agentcore.{REGION}.amazonaws.com/mcp"
 )
 
+# ─── HTTP session ────────────────────────────────────────────────────────────
+# One HTTP/2 client so every MCP call is multiplexed over a single TLS connection
+HTTP_CLIENT = httpx.Client(http2=True, timeout=30.0)
+
 # ─── SigV4 signing ───────────────────────────────────────────────────────────
 
-def sign_request(method: str, url: str, body: str) -> dict:
-    """Sign request with AWS SigV4."""
-    headers = {"Content-Type": "application/json"}
-    req = AWSRequest(method=method, url=url, data=body, headers=headers)
-    creds = boto3.Session().get_credentials().get_frozen_credentials()
-    SigV4Auth(creds, SERVICE_NAME, REGION).add_auth(req)
-    return dict(req.headers)
+# Credentials are resolved once and reused for every MCP call
+_CREDS = boto3.Session().get_credentials().get_frozen_credentials()
+
+
+def _hmac_sha256(key: bytes, msg: str) -> bytes:
+    return hmac.new(key, msg.encode("utf-8"), hashlib.sha256).digest()
+
+
+@lru_cache(maxsize=2)
+def _signing_key(date_stamp: str) -> bytes:
+    """
+    Derive the SigV4 signing key (kDate → kRegion → kService → kSigning).
+    It only depends on the secret key, date, region and service, so it is
+    computed once per UTC day instead of on every request.
+    """
+    k_date    = _hmac_sha256(f"AWS4{_CREDS.secret_key}".encode("utf-8"), date_stamp)
+    k_region  = _hmac_sha256(k_date, REGION)
+    k_service = _hmac_sha256(k_region, SERVICE_NAME)
+    return _hmac_sha256(k_service, "aws4_request")
+
+
+def sign_request(method: str, url: str, body: bytes) -> dict:
+    """
+    Sign request with AWS SigV4.
+    Per call this only hashes the payload and canonical request and computes
+    the final HMAC; the signing key comes from _signing_key().
+    """
+    parts      = urlsplit(url)
+    amz_date   = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    date_stamp = amz_date[:8]
+
+    signed = {
+        "content-type": "application/json",
+        "host": parts.netloc,
+        "x-amz-date": amz_date,
+    }
+    if _CREDS.token:
+        signed["x-amz-security-token"] = _CREDS.token
+    signed_headers = ";".join(sorted(signed))
+
+    canonical_request = "\n".join([
+        method,
+        quote(parts.path or "/", safe="/~"),
+        "&".join(sorted(
+            f"{quote(k, safe='-_.~')}={quote(v, safe='-_.~')}"
+            for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        )),
+        "".join(f"{k}:{signed[k]}\n" for k in sorted(signed)),
+        signed_headers,
+        hashlib.sha256(body).hexdigest(),
+    ])
+    scope = f"{date_stamp}/{REGION}/{SERVICE_NAME}/aws4_request"
+    string_to_sign = "\n".join([
+        "AWS4-HMAC-SHA256",
+        amz_date,
+        scope,
+        hashlib.sha256(canonical_request.encode("utf-8")).hexdigest(),
+    ])
+    signature = hmac.new(
+        _signing_key(date_stamp), string_to_sign.encode("utf-8"), hashlib.sha256
+    ).hexdigest()
+
+    headers = {
+        "Content-Type": signed["content-type"],
+        "Content-Length": str(len(body)),
+        "X-Amz-Date": amz_date,
+        "Authorization": (
+            f"AWS4-HMAC-SHA256 Credential={_CREDS.access_key}/{scope}, "
+            f"SignedHeaders={signed_headers}, Signature={signature}"
+        ),
+    }
+    if _CREDS.token:
+        headers["X-Amz-Security-Token"] = _CREDS.token
+    return headers
+
+
+# Compact encoder built once — MCP payloads don't need pretty-printing
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
 
 
 def mcp_call(method: str, params: dict = None, call_id: int = 1) -> dict:
@@ -62,16 +167,59 @@ def mcp_call(method: str, params: dict = None, call_id: int = 1) -> dict:
     payload = {"jsonrpc": "2.0", "id": call_id, "method": method}
     if params:
         payload["params"] = params
-    body = json.dumps(payload)
+    body = _JSON_ENCODER.encode(payload).encode("utf-8")
     headers = sign_request("POST", GATEWAY_URL, body)
-    resp = requests.post(GATEWAY_URL, headers=headers, data=body, timeout=30)
+    resp = HTTP_CLIENT.post(GATEWAY_URL, headers=headers, content=body)
     resp.raise_for_status()
     return resp.json()
 
 
+# ─── tools/list cache ────────────────────────────────────────────────────────
+# Tool names change rarely, so the tools/list response is cached locally per
+# gateway. Pass --refresh (or set CONFLUENCE_GATEWAY_NO_CACHE=1) to re-query.
+_TOOLS_CACHE_FILE = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+    "confluence-gateway",
+    "tools.json",
+)
+_TOOLS_CACHE_TTL_SECONDS = 60 * 60
+
+
+def list_tools_cached(refresh: bool = False) -> tuple:
+    """
+    Return (tools/list response, from_cache). The response comes from the
+    local cache when it is fresh, in which case the gateway was not contacted.
+    """
+    if not refresh:
+        try:
+            if time.time() - os.path.getmtime(_TOOLS_CACHE_FILE) < _TOOLS_CACHE_TTL_SECONDS:
+                with open(_TOOLS_CACHE_FILE, encoding="utf-8") as f:
+                    cached = json.load(f)
+                if isinstance(cached, dict) and cached.get("gateway_id") == GATEWAY_ID:
+                    return cached["response"], True
+        except (OSError, ValueError, KeyError):
+            pass
+
+    result = mcp_call("tools/list")
+    # Only cache successful responses so errors are retried on the next run
+    if "result" in result and "tools" in result["result"]:
+        try:
+            os.makedirs(os.path.dirname(_TOOLS_CACHE_FILE), exist_ok=True)
+            with open(_TOOLS_CACHE_FILE, "w", encoding="utf-8") as f:
+                json.dump({"gateway_id": GATEWAY_ID, "response": result}, f)
+        except OSError:
+            pass
+    return result, False
+
+
 # ─── Test cases ──────────────────────────────────────────────────────────────
 
-def test_list_tools() -> list:
+# The tools/call tests run concurrently; each prints its report under this
+# lock once its MCP call has returned so output blocks never interleave.
+_PRINT_LOCK = threading.Lock()
+
+
+def test_list_tools(refresh: bool = False) -> list:
     print("=" * 70)
     print("TEST: List Gateway Tools")
     print("=" * 70)
@@ -79,11 +227,14 @@ def test_list_tools() -> list:
     print(f"Gateway URL : {GATEWAY_URL}")
     print(f"Confluence  : {CONFLUENCE_SUBDOMAIN}.atlassian.net\n")
 
-    result = mcp_call("tools/list")
+    result, from_cache = list_tools_cached(refresh=refresh)
 
     if "result" in result and "tools" in result["result"]:
         tools = result["result"]["tools"]
-        print(f"✅ Gateway accessible — {len(tools)} tool(s) found:")
+        if from_cache:
+            print(f"{len(tools)} tool(s) (cached — pass --refresh to re-query):")
+        else:
+            print(f"✅ Gateway accessible — {len(tools)} tool(s) found:")
         for i, tool in enumerate(tools, 1):
             print(f"  {i}. {tool['name']}")
         return tools
@@ -94,10 +245,6 @@ def test_list_tools() -> list:
 
 
 def test_search_pages(tool_name: str):
-    print("\n" + "=" * 70)
-    print(f"TEST: Search Confluence Pages  [{tool_name}]")
-    print("=" * 70)
-
     result = mcp_call(
         "tools/call",
         params={
@@ -111,21 +258,22 @@ def test_search_pages(tool_name: str):
         call_id=2,
     )
 
-    if "result" in result and not result["result"].get("isError"):
-        data = json.loads(result["result"]["content"][0]["text"])
-        print(f"✅ SUCCESS — {data.get('totalSize', 0)} page(s) found:")
-        for page in data.get("results", [])[:3]:
-            print(f"  📄 {page['title']} (ID: {page['id']})")
-    else:
-        print("❌ Error:")
-        print(json.dumps(result, indent=2))
+    with _PRINT_LOCK:
+        print("\n" + "=" * 70)
+        print(f"TEST: Search Confluence Pages  [{tool_name}]")
+        print("=" * 70)
 
+        if "result" in result and not result["result"].get("isError"):
+            data = json.loads(result["result"]["content"][0]["text"])
+            print(f"✅ SUCCESS — {data.get('totalSize', 0)} page(s) found:")
+            for page in data.get("results", [])[:3]:
+                print(f"  📄 {page['title']} (ID: {page['id']})")
+        else:
+            print("❌ Error:")
+            print(json.dumps(result, indent=2))
 
-def test_get_page(tool_name: str, page_id: str = TEST_PAGE_ID):
-    print("\n" + "=" * 70)
-    print(f"TEST: Get Page by ID [{page_id}]  [{tool_name}]")
-    print("=" * 70)
 
+def test_get_page(tool_name: str, page_id: str = TEST_PAGE_ID):
     result = mcp_call(
         "tools/call",
         params={
@@ -138,22 +286,23 @@ def test_get_page(tool_name: str, page_id: str = TEST_PAGE_ID):
         call_id=3,
     )
 
-    if "result" in result and not result["result"].get("isError"):
-        data = json.loads(result["result"]["content"][0]["text"])
-        print(f"✅ SUCCESS:")
-        print(f"  📄 Title  : {data.get('title')}")
-        print(f"     ID     : {data.get('id')}")
-        print(f"     Status : {data.get('status')}")
-    else:
-        print("❌ Error:")
-        print(json.dumps(result, indent=2))
+    with _PRINT_LOCK:
+        print("\n" + "=" * 70)
+        print(f"TEST: Get Page by ID [{page_id}]  [{tool_name}]")
+        print("=" * 70)
 
+        if "result" in result and not result["result"].get("isError"):
+            data = json.loads(result["result"]["content"][0]["text"])
+            print(f"✅ SUCCESS:")
+            print(f"  📄 Title  : {data.get('title')}")
+            print(f"     ID     : {data.get('id')}")
+            print(f"     Status : {data.get('status')}")
+        else:
+            print("❌ Error:")
+            print(json.dumps(result, indent=2))
 
-def test_get_spaces(tool_name: str):
-    print("\n" + "=" * 70)
-    print(f"TEST: List Confluence Spaces  [{tool_name}]")
-    print("=" * 70)
 
+def test_get_spaces(tool_name: str):
     result = mcp_call(
         "tools/call",
         params={
@@ -166,20 +315,29 @@ def test_get_spaces(tool_name: str):
         call_id=4,
     )
 
-    if "result" in result and not result["result"].get("isError"):
-        data = json.loads(result["result"]["content"][0]["text"])
-        print(f"✅ SUCCESS — {data.get('totalSize', 0)} space(s):")
-        for space in data.get("results", []):
-            print(f"  📁 {space.get('name')} (Key: {space.get('key')})")
-    else:
-        print("❌ Error:")
-        print(json.dumps(result, indent=2))
+    with _PRINT_LOCK:
+        print("\n" + "=" * 70)
+        print(f"TEST: List Confluence Spaces  [{tool_name}]")
+        print("=" * 70)
+
+        if "result" in result and not result["result"].get("isError"):
+            data = json.loads(result["result"]["content"][0]["text"])
+            print(f"✅ SUCCESS — {data.get('totalSize', 0)} space(s):")
+            for space in data.get("results", []):
+                print(f"  📁 {space.get('name')} (Key: {space.get('key')})")
+        else:
+            print("❌ Error:")
+            print(json.dumps(result, indent=2))
 
 
 # ─── Main ─────────────────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
-    tools = test_list_tools()
+    refresh = (
+        "--refresh" in sys.argv[1:]
+        or os.environ.get("CONFLUENCE_GATEWAY_NO_CACHE") == "1"
+    )
+    tools = test_list_tools(refresh=refresh)
 
     if not tools:
         print("\n⚠️  No tools found. Attach a Confluence target to the gateway first.")
@@ -192,12 +350,19 @@ if __name__ == "__main__":
     get_page_tool  = find_tool("getPageById")
     get_space_tool = find_tool("getSpaces")
 
-    if search_tool:
-        test_search_pages(search_tool["name"])
-    if get_page_tool:
-        test_get_page(get_page_tool["name"])
-    if get_space_tool:
-        test_get_spaces(get_space_tool["name"])
+    # The tool-call tests are independent — run them concurrently
+    jobs = [
+        (test_fn, tool["name"])
+        for test_fn, tool in [
+            (test_search_pages, search_tool),
+            (test_get_page, get_page_tool),
+            (test_get_spaces, get_space_tool),
+        ]
+        if tool
+    ]
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        # list() drains the iterator so any exception from a test is re-raised
+        list(executor.map(lambda job: job[0](job[1]), jobs))
 
     print("\n" + "=" * 70)
     print("✅ ALL TESTS COMPLETE")